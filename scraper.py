@@ -1,6 +1,7 @@
 import time
 import json
 import logging
+import logging.handlers
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.service import Service
@@ -14,26 +15,215 @@ import os
 import re
 import concurrent.futures
 import threading
-from queue import Queue
+from queue import Queue, Empty
+from urllib.parse import urljoin
 import requests
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
 import multiprocessing
+from multiprocessing.util import Finalize
+from lxml import html
 
-# Configure logging
+try:
+    import diskcache
+except ImportError:
+    diskcache = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Configure logging (set LOG_LEVEL=WARNING to keep per-date INFO lines out of the file).
+# Records are buffered in memory and written in batches, or at once on a warning.
+_log_file = logging.FileHandler("ihc_scraper_fixed.log", encoding='utf-8', delay=True)
+_log_file.setFormatter(logging.Formatter("%(asctime)s - %(levelname)s - %(message)s"))
+_log_buffer = logging.handlers.MemoryHandler(capacity=512, flushLevel=logging.WARNING, target=_log_file)
 logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(levelname)s - %(message)s",
-    handlers=[
-        logging.FileHandler("ihc_scraper_fixed.log", encoding='utf-8')
-    ]
+    level=os.environ.get("LOG_LEVEL", "INFO").upper(),
+    handlers=[_log_buffer]
 )
 logger = logging.getLogger(__name__)
 
+# Search page locators, built once instead of per call
+_ADV_SEARCH_LINK = (By.ID, "lnkAdvncSrch")
+_DATE_INPUT = (By.ID, "txtDt")
+_SEARCH_BUTTON = (By.ID, "btnAdvnSrch")
+_RESULTS_TABLE = (By.ID, "tblCases")
+_NO_RECORDS = (By.ID, "lblNoRec")
+_TABLE_INFO = (By.ID, "tblCases_info")
+# A non-empty cell other than DataTables' "No data available" placeholder;
+# a whitespace-only cell can still match, so this is a hint, not a guarantee
+_POPULATED_CELL = (By.CSS_SELECTOR, "#tblCases tbody tr td:not(.dataTables_empty):not(:empty)")
+_EMPTY_CELL = (By.CSS_SELECTOR, "#tblCases tbody td.dataTables_empty")
+_NEXT_BUTTON = (By.CSS_SELECTOR, "#tblCases_paginate a.paginate_button.next")
+_FIRST_ROW = (By.CSS_SELECTOR, "#tblCases tbody tr")
+
+# Concurrent HTTP fetches of case detail pages per results page
+DETAIL_FETCH_WORKERS = 4
+
+# Upper bound on pages walked via Next when the page count can't be read
+MAX_PAGES = 50
+
+# Counsel found on case detail pages, keyed by case number; kept across runs
+# when diskcache is installed, otherwise only for the life of the process
+CACHE = diskcache.Cache(os.path.join("output", ".cache")) if diskcache else {}
+COUNSEL_TTL = 24 * 3600
+
+# Sub-resources the case search never needs; scripts stay so DataTables works
+BLOCKED_URLS = ["*.png", "*.jpg", "*.jpeg", "*.gif", "*.svg", "*.ico", "*.css", "*.woff*", "*.ttf", "*google-analytics*"]
+
+# Pre-compiled patterns, built once per process instead of once per row
+_CASE_NO_RE = re.compile(r'(W\.P\.?\s*\d+/\d{4}[^,]*|Crl\.?\s*[A-Z]*\.?\s*\d+/\d{4}[^,]*|Civil\s*[A-Z]*\.?\s*\d+/\d{4}[^,]*|[A-Z]+\.?\s*\d+/\d{4}[^,]*)', re.IGNORECASE)
+_TITLE_VS_RE = re.compile(r' VS | vs | V/S | v/s | - VS - | Vs ', re.IGNORECASE)
+_CATEGORY_RE = re.compile(r'NOTICE|REGULAR|URGENT|MISC|SUPPLIMENTRY', re.IGNORECASE)
+_INFO_RE = re.compile(r'([\d,]+)\s+to\s+([\d,]+)\s+of\s+([\d,]+)')
+_STATUS_RE = re.compile(r'decided|pending|disposed|fixed', re.IGNORECASE)
+
+_HEARING_PATTERNS = (
+    re.compile(r'(\w{3}\s+\d{2}-\d{2}-\d{4}\s*\([^)]+\))', re.IGNORECASE),
+    re.compile(r'(\d{2}-\d{2}-\d{4}\s*\([^)]+\))', re.IGNORECASE),
+    re.compile(r'(\w{3}\s+\d{2}/\d{2}/\d{4})', re.IGNORECASE),
+    re.compile(r'(\d{2}/\d{2}/\d{4})', re.IGNORECASE),
+    re.compile(r'(\d{2}-\d{2}-\d{4})', re.IGNORECASE),
+)
+
+_BENCH_PATTERNS = (
+    re.compile(r'Hon(?:ourable|\'ble)?\s+(?:Mr\.|Ms\.)?\s*Justice\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)', re.IGNORECASE),
+    re.compile(r'Justice\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)', re.IGNORECASE),
+)
+
+_COUNSEL_PETITIONER_PATTERNS = (
+    re.compile(r'Counsel\s+for\s+Petitioner[:\s]*([^<\n]+)', re.IGNORECASE),
+    re.compile(r'Petitioner[^:]*Counsel[:\s]*([^<\n]+)', re.IGNORECASE),
+    re.compile(r'For\s+Petitioner[:\s]*([A-Z][a-zA-Z\s]+)', re.IGNORECASE),
+    re.compile(r'Advocate\s+for\s+Petitioner[:\s]*([^<\n]+)', re.IGNORECASE),
+)
+
+_COUNSEL_RESPONDENT_PATTERNS = (
+    re.compile(r'Counsel\s+for\s+Respondent[:\s]*([^<\n]+)', re.IGNORECASE),
+    re.compile(r'Respondent[^:]*Counsel[:\s]*([^<\n]+)', re.IGNORECASE),
+    re.compile(r'For\s+Respondent[:\s]*([A-Z][a-zA-Z\s]+)', re.IGNORECASE),
+)
+
+_COUNSEL_ROLES = (
+    ("Petitioner", _COUNSEL_PETITIONER_PATTERNS),
+    ("Respondent", _COUNSEL_RESPONDENT_PATTERNS),
+)
+
+def find_counsel(text):
+    """Return {role: counsel} for the first usable counsel name of each role in text"""
+    found = {}
+    for role, patterns in _COUNSEL_ROLES:
+        for pattern in patterns:
+            match = pattern.search(text)
+            if match:
+                counsel = match.group(1).strip()
+                if len(counsel) > 3 and not any(x in counsel.lower() for x in ['not', 'n/a', 'nil', 'none']):
+                    found[role] = counsel
+                    break
+    return found
+
+# Collect only the rows (or elements) whose text mentions counsel or a party,
+# so the counsel patterns scan a few hundred bytes instead of the whole page
+_ADVOCATE_TEXT_JS = """
+    var walker = document.createTreeWalker(document.body, NodeFilter.SHOW_TEXT);
+    var seen = new Set(), parts = [];
+    while (walker.nextNode()) {
+        var node = walker.currentNode;
+        if (!/counsel|advocate|petitioner|respondent/i.test(node.nodeValue)) continue;
+        var el = node.parentElement.closest('tr') || node.parentElement;
+        if (!seen.has(el)) {
+            seen.add(el);
+            parts.push(el.innerText);
+        }
+    }
+    return parts.join('\\n');
+"""
+
+# Same filter as _ADVOCATE_TEXT_JS, for detail pages fetched over HTTP
+_ADVOCATE_HINT_RE = re.compile(r'counsel|advocate|petitioner|respondent', re.IGNORECASE)
+
+# Default case record. Immutable "N/A" leaves are shared; the lists and
+# nested dicts are rebuilt per case by new_case_data
+_DISPOSAL_SKELETON = {
+    "Disposed_Status": "N/A",
+    "Case_Disposal_Date": "N/A",
+    "Disposal_Bench": [],
+    "Consigned_Date": "N/A"
+}
+_FIR_SKELETON = {
+    "FIR_No": "N/A",
+    "FIR_Date": "N/A",
+    "Police_Station": "N/A",
+    "Under_Section": "N/A",
+    "Incident": "N/A",
+    "Accused": "N/A"
+}
+_DETAILS_SKELETON = {
+    "Case_No": "N/A",
+    "Case_Status": "N/A",
+    "Hearing_Date": "N/A",
+    "Case_Stage": "N/A",
+    "Tentative_Date": "N/A",
+    "Short_Order": "N/A",
+    "Before_Bench": [],
+    "Case_Title": "N/A",
+    "Advocates": None,
+    "Case_Description": "N/A",
+    "Disposal_Information": None,
+    "FIR_Information": None
+}
+_CASE_SKELETON = {
+    "Sr": None,
+    "Institution_Date": None,
+    "Case_No": "N/A",
+    "Case_Title": "N/A",
+    "Bench": [],
+    "Hearing_Date": "N/A",
+    "Case_Category": "N/A",
+    "Status": "N/A",
+    "Orders": None,
+    "Comments": None,
+    "CMs": None,
+    "Details": None
+}
+
+def new_case_data(sr_number, date):
+    """Build an empty case record from the skeletons (faster than deepcopy)"""
+    details = {
+        **_DETAILS_SKELETON,
+        "Before_Bench": [],
+        "Advocates": {"Petitioner": "N/A", "Respondent": "N/A"},
+        "Disposal_Information": {**_DISPOSAL_SKELETON, "Disposal_Bench": []},
+        "FIR_Information": {**_FIR_SKELETON}
+    }
+    return {
+        **_CASE_SKELETON,
+        "Sr": sr_number,
+        "Institution_Date": date,
+        "Bench": [],
+        "Orders": [],
+        "Comments": [],
+        "CMs": [],
+        "Details": details
+    }
+
 class FastIHCScraper:
+    # chromedriver binary path, resolved once and shared by every driver
+    _driver_path = None
+    _driver_path_lock = threading.Lock()
+
     def __init__(self, max_workers=4):
         self.max_workers = max_workers
-        self.results_lock = threading.Lock()
-        self.all_cases = []
+        # Idle, already-started drivers; grows to at most max_workers
+        self._driver_pool = Queue()
+        # HTTP sessions sharing each driver's cookies, keyed by WebDriver session id
+        self._sessions = {}
+        # Detail page fetchers, started on first use and kept until close(); each
+        # thread sends requests through its own Session (see _thread_session)
+        self._detail_executor = None
+        self._local = threading.local()
+        self._thread_sessions = []
         
     def setup_webdriver(self):
         """Setup Chrome WebDriver with optimized options"""
@@ -46,13 +236,18 @@ class FastIHCScraper:
             options.add_argument("--disable-extensions")
             options.add_argument("--disable-notifications")
             options.add_argument("--disable-popup-blocking")
-            options.add_argument("--headless")
+            options.add_argument("--headless=new")
             options.add_argument("--window-size=1400,1000")
             
             # Additional speed optimizations
             options.add_argument("--disable-images")
+            options.add_argument("--blink-settings=imagesEnabled=false")
             options.add_argument("--no-first-run")
             options.add_argument("--disable-default-apps")
+            options.add_argument("--disable-background-networking")
+            options.add_argument("--disable-sync")
+            options.add_argument("--disable-translate")
+            options.add_argument("--mute-audio")
             
             options.add_experimental_option("useAutomationExtension", False)
             options.add_experimental_option("excludeSwitches", ["enable-automation"])
@@ -66,40 +261,140 @@ class FastIHCScraper:
                     "notifications": 2,
                     "media_stream": 2,
                     "images": 2  # Disable images for speed
-                }
+                },
+                "profile.managed_default_content_settings.images": 2
             }
             options.add_experimental_option("prefs", prefs)
             
-            service = Service(ChromeDriverManager().install())
+            if FastIHCScraper._driver_path is None:
+                with FastIHCScraper._driver_path_lock:
+                    if FastIHCScraper._driver_path is None:
+                        FastIHCScraper._driver_path = ChromeDriverManager().install()
+            service = Service(FastIHCScraper._driver_path)
             driver = webdriver.Chrome(service=service, options=options)
-            driver.implicitly_wait(5)
             driver.set_page_load_timeout(20)
             
+            # Drop styles, fonts, images and analytics at the network layer
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URLS})
+            
             return driver
         except Exception as e:
             logger.error(f"Failed to initialize WebDriver: {str(e)}")
             raise
 
-    def extract_clean_text(self, element):
-        """Extract and clean text from web element"""
+    def _acquire_driver(self):
+        """Take an idle driver from the pool, starting a new one if none is free"""
         try:
-            text = element.get_attribute('textContent') or element.text or ""
-            return re.sub(r'\s+', ' ', text.strip()) if text.strip() else "N/A"
-        except:
-            return "N/A"
+            return self._driver_pool.get_nowait()
+        except Empty:
+            return self.setup_webdriver()
+
+    def _release_driver(self, driver):
+        """Reset a driver and return it to the pool, or quit it if it no longer responds"""
+        try:
+            driver.delete_all_cookies()
+            # Clear the site's storage while still on its origin
+            driver.execute_script(
+                "try { window.localStorage.clear(); window.sessionStorage.clear(); } catch (e) {}")
+            driver.get("about:blank")
+            self._driver_pool.put(driver)
+        except Exception as e:
+            logger.warning(f"Discarding unresponsive WebDriver: {e}")
+            session = self._sessions.pop(driver.session_id, None)
+            if session is not None:
+                session.close()
+            try:
+                driver.quit()
+            except Exception:
+                pass
+
+    def _sync_session(self, driver):
+        """Copy the driver's cookies into its HTTP session so detail pages skip the browser"""
+        try:
+            session = self._sessions.get(driver.session_id)
+            if session is None:
+                session = requests.Session()
+                session.headers["User-Agent"] = driver.execute_script("return navigator.userAgent")
+                self._sessions[driver.session_id] = session
+            session.cookies.clear()
+            for cookie in driver.get_cookies():
+                session.cookies.set(cookie["name"], cookie["value"], domain=cookie.get("domain"))
+        except Exception as e:
+            logger.warning(f"Could not share cookies with HTTP session: {e}")
+            self._sessions.pop(driver.session_id, None)
+
+    def _thread_session(self, shared):
+        """This thread's own HTTP session, sending the shared session's headers"""
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._local.session = requests.Session()
+            self._thread_sessions.append(session)
+        session.headers.update(shared.headers)
+        return session
+
+    def _fetch_advocate_text(self, driver, url):
+        """Fetch a detail page over HTTP and return its advocate rows, or None"""
+        shared = self._sessions.get(driver.session_id)
+        if shared is None:
+            return None
+        response = self._thread_session(shared).get(url, timeout=15, cookies=shared.cookies)
+        response.raise_for_status()
+        page = html.fromstring(response.content)
+        
+        # Keep the table row (or element) around each matching text node once
+        seen = set()
+        parts = []
+        for text in page.xpath('//body//text()'):
+            if not _ADVOCATE_HINT_RE.search(text):
+                continue
+            parent = text.getparent()
+            row = parent if parent.tag == 'tr' else next(parent.iterancestors('tr'), parent)
+            if row not in seen:
+                seen.add(row)
+                # Tab-separated cells with collapsed whitespace, like innerText
+                cells = row.xpath('./td|./th') or [row]
+                parts.append('\t'.join(' '.join(c.text_content().split()) for c in cells))
+        return '\n'.join(parts) or None
+
+    def _fetch_counsel(self, driver, url, case_no):
+        """Counsel found on a detail page fetched over HTTP, cached by case number"""
+        key = ("counsel", case_no)
+        counsel = CACHE.get(key)
+        if counsel is None:
+            counsel = find_counsel(self._fetch_advocate_text(driver, url) or "")
+            # Empty results go to the browser fallback, so only cache real hits
+            if counsel and diskcache:
+                CACHE.set(key, counsel, expire=COUNSEL_TTL)
+            elif counsel:
+                CACHE[key] = counsel
+        return counsel
+
+    def close(self):
+        """Quit every pooled driver"""
+        if self._detail_executor is not None:
+            self._detail_executor.shutdown()
+            self._detail_executor = None
+        for session in self._thread_sessions:
+            session.close()
+        self._thread_sessions.clear()
+        for session in self._sessions.values():
+            session.close()
+        self._sessions.clear()
+        while True:
+            try:
+                driver = self._driver_pool.get_nowait()
+            except Empty:
+                break
+            try:
+                driver.quit()
+            except Exception:
+                pass
 
     def parse_hearing_date(self, text):
         """Parse hearing date from various formats - optimized"""
         try:
-            patterns = [
-                re.compile(r'(\w{3}\s+\d{2}-\d{2}-\d{4}\s*\([^)]+\))', re.IGNORECASE),
-                re.compile(r'(\d{2}-\d{2}-\d{4}\s*\([^)]+\))', re.IGNORECASE),
-                re.compile(r'(\w{3}\s+\d{2}/\d{2}/\d{4})', re.IGNORECASE),
-                re.compile(r'(\d{2}/\d{2}/\d{4})', re.IGNORECASE),
-                re.compile(r'(\d{2}-\d{2}-\d{4})', re.IGNORECASE),
-            ]
-            
-            for pattern in patterns:
+            for pattern in _HEARING_PATTERNS:
                 match = pattern.search(text)
                 if match:
                     return match.group(1).strip()
@@ -113,12 +408,7 @@ class FastIHCScraper:
         try:
             bench_names = []
             
-            patterns = [
-                re.compile(r'Hon(?:ourable|\'ble)?\s+(?:Mr\.|Ms\.)?\s*Justice\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)', re.IGNORECASE),
-                re.compile(r'Justice\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)', re.IGNORECASE),
-            ]
-            
-            for pattern in patterns:
+            for pattern in _BENCH_PATTERNS:
                 matches = pattern.findall(text)
                 for match in matches:
                     if len(match.strip()) > 2:
@@ -130,60 +420,61 @@ class FastIHCScraper:
         except:
             return []
 
-    def extract_advocate_info_fast(self, driver, case_link, case_data):
-        """Fast advocate extraction - only extract advocate info from details"""
+    def extract_advocate_info_fast(self, driver, case_link, case_data, prefetched=None):
+        """Fast advocate extraction - only extract advocate info from details
+        
+        case_link is the detail page URL, or the link element to click when
+        the anchor has no navigable URL. prefetched maps case numbers already
+        fetched over HTTP to their counsel.
+        """
+        if isinstance(case_link, str):
+            # Plain GET with the search session's cookies; no page render needed
+            case_no = case_data["Case_No"]
+            try:
+                if prefetched is not None and case_no in prefetched:
+                    counsel = prefetched[case_no]
+                else:
+                    counsel = self._fetch_counsel(driver, case_link, case_no)
+                if counsel:
+                    case_data["Details"]["Advocates"].update(counsel)
+                    return
+            except Exception as e:
+                logger.debug("HTTP detail fetch failed, using the browser: %s", e)
+        
         original_window = driver.current_window_handle
         
         try:
-            # Click case link quickly
-            driver.execute_script("arguments[0].click();", case_link)
-            time.sleep(2)
-            
-            # Handle new window
-            windows = driver.window_handles
-            if len(windows) > 1:
-                for window in windows:
-                    if window != original_window:
-                        driver.switch_to.window(window)
-                        break
-            
-            # Quick wait and extract only advocate info
-            time.sleep(2)
-            page_source = driver.page_source
+            if isinstance(case_link, str):
+                # Open the detail page in its own tab so the results page stays put
+                driver.switch_to.new_window('tab')
+                driver.get(case_link)
+            else:
+                # Click case link quickly
+                driver.execute_script("arguments[0].click();", case_link)
+                try:
+                    WebDriverWait(driver, 5, poll_frequency=0.1).until(
+                        lambda d: len(d.window_handles) > 1)
+                except TimeoutException:
+                    pass
+                
+                # Handle new window
+                windows = driver.window_handles
+                if len(windows) > 1:
+                    for window in windows:
+                        if window != original_window:
+                            driver.switch_to.window(window)
+                            break
+                
+                # Wait for the detail page to finish loading
+                WebDriverWait(driver, 10, poll_frequency=0.1).until(
+                    lambda d: d.execute_script("return document.readyState") == "complete")
+            advocate_text = driver.execute_script(_ADVOCATE_TEXT_JS) or driver.page_source
             
             # Extract advocate information quickly
-            counsel_patterns = [
-                r'Counsel\s+for\s+Petitioner[:\s]*([^<\n]+)',
-                r'Petitioner[^:]*Counsel[:\s]*([^<\n]+)', 
-                r'For\s+Petitioner[:\s]*([A-Z][a-zA-Z\s]+)',
-                r'Advocate\s+for\s+Petitioner[:\s]*([^<\n]+)'
-            ]
-            
-            for pattern in counsel_patterns:
-                matches = re.findall(pattern, page_source, re.IGNORECASE)
-                if matches:
-                    counsel = matches[0].strip()
-                    if len(counsel) > 3 and not any(x in counsel.lower() for x in ['not', 'n/a', 'nil', 'none']):
-                        case_data["Details"]["Advocates"]["Petitioner"] = counsel
-                        break
-            
-            # Try to get respondent counsel too
-            respondent_patterns = [
-                r'Counsel\s+for\s+Respondent[:\s]*([^<\n]+)',
-                r'Respondent[^:]*Counsel[:\s]*([^<\n]+)',
-                r'For\s+Respondent[:\s]*([A-Z][a-zA-Z\s]+)'
-            ]
-            
-            for pattern in respondent_patterns:
-                matches = re.findall(pattern, page_source, re.IGNORECASE)
-                if matches:
-                    counsel = matches[0].strip()
-                    if len(counsel) > 3 and not any(x in counsel.lower() for x in ['not', 'n/a', 'nil', 'none']):
-                        case_data["Details"]["Advocates"]["Respondent"] = counsel
-                        break
+            case_data["Details"]["Advocates"].update(find_counsel(advocate_text))
             
         except Exception as e:
-            logger.warning(f"Quick advocate extraction failed: {e}")
+            logger.warning("Quick advocate extraction failed: %s", e)
         finally:
             # Quick cleanup
             try:
@@ -191,97 +482,136 @@ class FastIHCScraper:
                 if len(windows) > 1:
                     driver.close()
                     driver.switch_to.window(original_window)
-                time.sleep(0.5)
             except:
                 pass
 
-    def extract_table_row_data_fast(self, row, sr_number, date, driver):
+    def _dump_table_html(self, driver):
+        """Return every results row as [cell_texts, cell_links] from one outerHTML fetch
+        
+        The table is parsed with lxml so no per-row or per-cell WebDriver calls
+        are made. Cell texts are whitespace-collapsed ("N/A" when empty). A link
+        entry is the cell's first anchor href made absolute, "" for an anchor
+        without a URL (no href, "#..." or "javascript:"), or None.
+        """
+        table_html = driver.execute_script(
+            "var t = document.getElementById('tblCases'); return t ? t.outerHTML : '';")
+        if not table_html:
+            return []
+        table = html.fragment_fromstring(table_html)
+        base_url = driver.current_url
+        rows = []
+        # Data rows only: header rows hold th cells and never match tr[td]
+        for row in table.xpath('.//tbody//tr[td]'):
+            cells = row.xpath('./td|./th')
+            texts = [' '.join(c.text_content().split()) or "N/A" for c in cells]
+            links = []
+            for c in cells:
+                anchor = c.find('.//a')
+                if anchor is None:
+                    links.append(None)
+                    continue
+                # Check the raw href: made absolute, "#" would look like the search page
+                href = (anchor.get('href') or "").strip()
+                if not href or href.startswith('#') or href.lower().startswith('javascript:'):
+                    links.append("")
+                else:
+                    links.append(urljoin(base_url, href))
+            rows.append([texts, links])
+        return rows
+
+    def _locate_case_link(self, driver, row_index, cell_index):
+        """Re-locate a case link element by its row and cell position"""
+        # Same row and cell selection as _dump_table_html, so the indexes line up;
+        # CSS selectors resolved in one script call instead of three XPath lookups
+        link = driver.execute_script("""
+            var row = document.querySelectorAll('#tblCases tbody tr:has(> td)')[arguments[0]];
+            var cell = row && row.querySelectorAll(':scope > td, :scope > th')[arguments[1]];
+            return cell ? cell.querySelector('a') : null;
+        """, row_index, cell_index)
+        if link is None:
+            raise NoSuchElementException(f"No case link in row {row_index}, cell {cell_index}")
+        return link
+
+    def _row_case_no(self, cell_texts, all_text=None):
+        """Return the row's case number, or None"""
+        all_text = all_text or " | ".join(cell_texts)
+        # Every case number form contains "/", so a row without one skips the regex
+        case_match = _CASE_NO_RE.search(all_text) if '/' in all_text else None
+        return case_match.group(1).strip() if case_match else None
+
+    def _scan_row_cells(self, cell_texts, cell_links):
+        """Return the row's title cell and its (cell_index, href) case link, either may be None"""
+        case_link = None
+        for i, cell_text in enumerate(cell_texts):
+            if _TITLE_VS_RE.search(cell_text):
+                return cell_text, case_link
+            
+            # Also check for case number with clickable link
+            if cell_links[i] is not None and '/' in cell_text and _CASE_NO_RE.search(cell_text):
+                case_link = (i, cell_links[i])
+        return None, case_link
+
+    def _prefetch_counsel(self, driver, rows):
+        """Fetch the detail pages of a page's rows concurrently over HTTP
+        
+        Returns {case_no: counsel}; a failed fetch maps to None so that row goes
+        straight to the browser instead of retrying over HTTP.
+        """
+        if driver.session_id not in self._sessions:
+            return {}
+        links = {}
+        for _, cell_texts, cell_links in rows:
+            case_no = self._row_case_no(cell_texts)
+            _, case_link = self._scan_row_cells(cell_texts, cell_links)
+            if case_no and case_link and case_link[1].startswith(("http://", "https://")):
+                links.setdefault(case_no, case_link[1])
+        
+        def fetch(item):
+            case_no, url = item
+            try:
+                return case_no, self._fetch_counsel(driver, url, case_no)
+            except Exception as e:
+                logger.debug("HTTP detail fetch failed for %s: %s", url, e)
+                return case_no, None
+        
+        if self._detail_executor is None:
+            self._detail_executor = ThreadPoolExecutor(max_workers=DETAIL_FETCH_WORKERS)
+        return dict(self._detail_executor.map(fetch, links.items()))
+
+    def extract_table_row_data_fast(self, cell_texts, cell_links, row_index, sr_number, date, driver, prefetched=None):
         """Fast table row data extraction with selective advocate lookup"""
         try:
-            cells = row.find_elements(By.TAG_NAME, "td")
-            if len(cells) < 3:
+            if len(cell_texts) < 3:
                 return None
 
-            # Pre-extract all cell texts at once
-            cell_texts = [self.extract_clean_text(cell) for cell in cells]
-            
-            # Initialize case data structure with defaults
-            case_data = {
-                "Sr": sr_number,
-                "Institution_Date": date,
-                "Case_No": "N/A",
-                "Case_Title": "N/A",
-                "Bench": [],
-                "Hearing_Date": "N/A",
-                "Case_Category": "N/A",
-                "Status": "N/A",
-                "Orders": [],
-                "Comments": [],
-                "CMs": [],
-                "Details": {
-                    "Case_No": "N/A",
-                    "Case_Status": "N/A",
-                    "Hearing_Date": "N/A",
-                    "Case_Stage": "N/A",
-                    "Tentative_Date": "N/A",
-                    "Short_Order": "N/A",
-                    "Before_Bench": [],
-                    "Case_Title": "N/A",
-                    "Advocates": {"Petitioner": "N/A", "Respondent": "N/A"},
-                    "Case_Description": "N/A",
-                    "Disposal_Information": {
-                        "Disposed_Status": "N/A",
-                        "Case_Disposal_Date": "N/A",
-                        "Disposal_Bench": [],
-                        "Consigned_Date": "N/A"
-                    },
-                    "FIR_Information": {
-                        "FIR_No": "N/A",
-                        "FIR_Date": "N/A",
-                        "Police_Station": "N/A",
-                        "Under_Section": "N/A",
-                        "Incident": "N/A",
-                        "Accused": "N/A"
-                    }
-                }
-            }
-
-            # Pre-compiled regex patterns for speed
-            case_no_pattern = re.compile(r'(W\.P\.?\s*\d+/\d{4}[^,]*|Crl\.?\s*[A-Z]*\.?\s*\d+/\d{4}[^,]*|Civil\s*[A-Z]*\.?\s*\d+/\d{4}[^,]*|[A-Z]+\.?\s*\d+/\d{4}[^,]*)', re.IGNORECASE)
-            title_vs_pattern = re.compile(r' VS | vs | V/S | v/s | - VS - | Vs ', re.IGNORECASE)
-            category_pattern = re.compile(r'NOTICE|REGULAR|URGENT|MISC|SUPPLIMENTRY', re.IGNORECASE)
-            status_pattern = re.compile(r'decided|pending|disposed|fixed', re.IGNORECASE)
-            
             # Fast extraction from all cells
             all_text = " | ".join(cell_texts)  # Combine for faster searching
             
-            # Extract case number
-            case_match = case_no_pattern.search(all_text)
-            if case_match:
-                case_data["Case_No"] = case_match.group(1).strip()
-                case_data["Details"]["Case_No"] = case_match.group(1).strip()
+            # Rows without a case number are dropped, so stop before any other work
+            case_no = self._row_case_no(cell_texts, all_text)
+            if not case_no:
+                return None
+
+            # Initialize case data structure with defaults
+            case_data = new_case_data(sr_number, date)
+            case_data["Case_No"] = case_no
+            case_data["Details"]["Case_No"] = case_data["Case_No"]
             
             # Extract case title and look for clickable case links
-            case_link = None
-            for i, cell in enumerate(cells):
-                cell_text = cell_texts[i]
-                if title_vs_pattern.search(cell_text):
-                    case_data["Case_Title"] = cell_text
-                    case_data["Details"]["Case_Title"] = cell_text
-                    break
-                
-                # Also check for case number with clickable link
-                if case_no_pattern.search(cell_text):
-                    links = cell.find_elements(By.TAG_NAME, "a")
-                    if links:
-                        case_link = links[0]  # Store for later use
+            title, case_link = self._scan_row_cells(cell_texts, cell_links)
+            if title:
+                case_data["Case_Title"] = title
+                case_data["Details"]["Case_Title"] = title
             
             # If we found a clickable case link, extract advocate info
             if case_link:
                 try:
-                    self.extract_advocate_info_fast(driver, case_link, case_data)
+                    cell_index, href = case_link
+                    if not href.startswith(("http://", "https://")):
+                        href = self._locate_case_link(driver, row_index, cell_index)
+                    self.extract_advocate_info_fast(driver, href, case_data, prefetched)
                 except Exception as e:
-                    logger.warning(f"Could not extract advocate info: {e}")
+                    logger.warning("Could not extract advocate info: %s", e)
             
             # Extract bench names
             bench_names = self.parse_bench_names_fast(all_text)
@@ -296,21 +626,17 @@ class FastIHCScraper:
                 case_data["Details"]["Hearing_Date"] = hearing_date
             
             # Extract category
-            category_match = category_pattern.search(all_text)
+            category_match = _CATEGORY_RE.search(all_text)
             if category_match:
                 case_data["Case_Category"] = category_match.group(0).upper() + " CASES"
                 case_data["Details"]["Case_Stage"] = category_match.group(0).upper()
             
             # Extract status
-            status_match = status_pattern.search(all_text)
+            status_match = _STATUS_RE.search(all_text)
             if status_match:
                 case_data["Status"] = status_match.group(0).title()
                 case_data["Details"]["Case_Status"] = status_match.group(0).title()
 
-            # Skip this case if no case number found
-            if case_data["Case_No"] == "N/A":
-                return None
-
             # Set default orders
             case_data["Orders"] = [{
                 "Sr": 1,
@@ -354,37 +680,43 @@ class FastIHCScraper:
             return case_data
 
         except Exception as e:
-            logger.error(f"Error extracting case {sr_number}: {e}")
+            logger.error("Error extracting case %s: %s", sr_number, e)
             return None
 
     def extract_cases_from_page_fast(self, driver, date, page_num, starting_sr, thread_id=0, max_cases_per_page=None):
         """Fast case extraction from page"""
         cases = []
         try:
-            wait = WebDriverWait(driver, 15)
-            table = wait.until(EC.visibility_of_element_located((By.ID, "tblCases")))
+            # An empty table only ever shows the placeholder cell, so stop there
+            cell = WebDriverWait(driver, 15, poll_frequency=0.2).until(EC.any_of(
+                EC.presence_of_element_located(_POPULATED_CELL),
+                EC.presence_of_element_located(_EMPTY_CELL)))
+            if 'dataTables_empty' in (cell.get_attribute('class') or ''):
+                print(f"Thread {thread_id}: Page {page_num} - No rows")
+                return cases
             
-            # Get all rows at once
-            rows = table.find_elements(By.XPATH, ".//tbody/tr")
+            # Get all rows' texts and links in a single call
+            rows = self._dump_table_html(driver)
             print(f"Thread {thread_id}: Page {page_num} - Found {len(rows)} rows")
             
-            # Filter data rows quickly
-            data_rows = []
-            for row in rows:
-                cells = row.find_elements(By.TAG_NAME, "td")
-                if len(cells) >= 3:
-                    first_cell_text = self.extract_clean_text(cells[0])
-                    if not any(header in first_cell_text.lower() for header in ['sr', 'case', 'title', 'bench']):
-                        data_rows.append(row)
+            # Header rows are already excluded; skip short placeholder rows
+            data_rows = [
+                (row_index, cell_texts, cell_links)
+                for row_index, (cell_texts, cell_links) in enumerate(rows)
+                if len(cell_texts) >= 3
+            ]
             
             # Limit for testing
             rows_to_process = data_rows[:max_cases_per_page] if max_cases_per_page else data_rows
             
+            # Detail pages are independent, so fetch them in parallel up front
+            prefetched = self._prefetch_counsel(driver, rows_to_process)
+            
             # Process rows
-            for i, row in enumerate(rows_to_process):
+            for i, (row_index, cell_texts, cell_links) in enumerate(rows_to_process):
                 try:
                     sr_number = starting_sr + i
-                    case_data = self.extract_table_row_data_fast(row, sr_number, date, driver)
+                    case_data = self.extract_table_row_data_fast(cell_texts, cell_links, row_index, sr_number, date, driver, prefetched)
                     
                     if case_data:
                         cases.append(case_data)
@@ -392,7 +724,7 @@ class FastIHCScraper:
                             print(f"Thread {thread_id}: Processed {i+1}/{len(rows_to_process)} cases")
                         
                 except Exception as e:
-                    logger.warning(f"Thread {thread_id}: Error processing row {i}: {e}")
+                    logger.warning("Thread %s: Error processing row %s: %s", thread_id, i, e)
                     continue
             
             print(f"Thread {thread_id}: Page {page_num} completed - {len(cases)}/{len(rows_to_process)} cases extracted")
@@ -406,11 +738,10 @@ class FastIHCScraper:
         """Fast single date scraping"""
         driver = None
         try:
-            driver = self.setup_webdriver()
+            driver = self._acquire_driver()
             logger.info(f"Thread {thread_id}: Starting FAST scrape for {date}")
             
             cases = []
-            page = 1
             total_cases_count = 0
             
             print(f"Thread {thread_id}: Navigating to IHC website for {date}...")
@@ -418,26 +749,34 @@ class FastIHCScraper:
             wait = WebDriverWait(driver, 15)
             
             # Setup search
-            adv_btn = wait.until(EC.element_to_be_clickable((By.ID, "lnkAdvncSrch")))
+            adv_btn = wait.until(EC.element_to_be_clickable(_ADV_SEARCH_LINK))
             adv_btn.click()
-            time.sleep(2)
             
-            date_input = wait.until(EC.presence_of_element_located((By.ID, "txtDt")))
+            date_input = WebDriverWait(driver, 15, poll_frequency=0.1).until(
+                EC.visibility_of_element_located(_DATE_INPUT))
             date_input.clear()
             date_input.send_keys(date)
-            time.sleep(1)
             
-            search_btn = wait.until(EC.element_to_be_clickable((By.ID, "btnAdvnSrch")))
+            search_btn = wait.until(EC.element_to_be_clickable(_SEARCH_BUTTON))
             search_btn.click()
-            time.sleep(8)
             
-            # Wait for results
-            wait.until(EC.visibility_of_element_located((By.ID, "grdCaseInfo")))
-            wait.until(EC.visibility_of_element_located((By.ID, "tblCases")))
-            time.sleep(2)
+            # Wait for either the results table or the no-records label
+            WebDriverWait(driver, 30, poll_frequency=0.2).until(EC.any_of(
+                EC.visibility_of_element_located(_RESULTS_TABLE),
+                EC.visibility_of_element_located(_NO_RECORDS)))
+            if not any(t.is_displayed() for t in driver.find_elements(*_RESULTS_TABLE)):
+                print(f"Thread {thread_id}: No records for {date}")
+                return cases
+            self.show_all_rows(driver)
+            self._sync_session(driver)
             
-            # Process all pages quickly
-            while True:
+            # Page count is read once up front instead of probing Next after each page;
+            # if it can't be read, follow Next until it is disabled (up to MAX_PAGES)
+            num_pages = self.get_page_count(driver)
+            if num_pages == 0:
+                print(f"Thread {thread_id}: No records for {date}")
+                return cases
+            for page in range(1, (MAX_PAGES if num_pages is None else num_pages) + 1):
                 starting_sr = total_cases_count + 1
                 page_cases = self.extract_cases_from_page_fast(
                     driver, date, page, starting_sr, thread_id, 
@@ -452,11 +791,15 @@ class FastIHCScraper:
                     print(f"Thread {thread_id}: Reached max cases limit ({max_cases_per_date})")
                     break
                 
-                if not self.has_next_page_fast(driver):
+                if num_pages is None:
+                    if not self.has_next_page(driver):
+                        break
+                    if page == MAX_PAGES:
+                        logger.warning(f"Thread {thread_id}: Stopped {date} at the {MAX_PAGES} page limit")
+                        break
+                elif page >= num_pages:
                     break
-                
-                page += 1
-                if page > 50:
+                if not self.next_page_fast(driver):
                     break
             
             logger.info(f"Thread {thread_id}: Completed {date} - {len(cases)} cases")
@@ -467,40 +810,83 @@ class FastIHCScraper:
             return []
         finally:
             if driver:
-                driver.quit()
+                self._release_driver(driver)
 
-    def has_next_page_fast(self, driver):
-        """Fast pagination check"""
+    def show_all_rows(self, driver):
+        """Raise the DataTable page length so a date's rows load without Next clicks"""
         try:
-            wait = WebDriverWait(driver, 8)
-            pagination_div = wait.until(EC.presence_of_element_located((By.ID, "tblCases_paginate")))
-            
-            next_button = pagination_div.find_element(By.XPATH, ".//a[contains(@class, 'paginate_button') and contains(@class, 'next')]")
-            button_classes = next_button.get_attribute('class')
+            info = driver.find_element(*_TABLE_INFO).text
+            match = _INFO_RE.search(info)
+            if not match:
+                return
+            shown, total = (int(g.replace(',', '')) for g in match.group(2, 3))
+            if shown >= total:
+                return
             
-            if 'disabled' in button_classes:
-                return False
-            else:
-                driver.execute_script("arguments[0].click();", next_button)
-                time.sleep(3)
-                return True
-                
+            # Use "All" or the largest option the length menu offers, else ask for 500
+            driver.execute_script("""
+                var lengths = $('select[name="tblCases_length"] option').map(function () { return +this.value; }).get();
+                var len = 500;
+                if (lengths.length) {
+                    len = lengths.indexOf(-1) >= 0 ? -1 : Math.max.apply(null, lengths);
+                }
+                $('#tblCases').DataTable().page.len(len).draw();
+            """)
+            WebDriverWait(driver, 15, poll_frequency=0.2).until(
+                lambda d: d.find_element(*_TABLE_INFO).text != info)
+        except Exception as e:
+            logger.warning(f"Could not raise page length: {e}")
+
+    def get_page_count(self, driver):
+        """Number of result pages, from the DataTables "Showing x to y of n" text, or None"""
+        try:
+            match = _INFO_RE.search(driver.find_element(*_TABLE_INFO).text)
+            first, last, total = (int(g.replace(',', '')) for g in match.groups())
+            page_size = max(last - first + 1, 1)
+            return -(-total // page_size)
+        except Exception as e:
+            logger.warning(f"Could not read page count, following Next instead: {e}")
+            return None
+
+    def has_next_page(self, driver):
+        """Whether the Next button is present and enabled"""
+        buttons = driver.find_elements(*_NEXT_BUTTON)
+        return bool(buttons) and 'disabled' not in (buttons[0].get_attribute('class') or '')
+
+    def next_page_fast(self, driver):
+        """Click Next and wait for the table to redraw"""
+        try:
+            info = driver.find_elements(*_TABLE_INFO)
+            info_text = info[0].text if info else None
+            first_row = driver.find_element(*_FIRST_ROW)
+            next_button = driver.find_element(*_NEXT_BUTTON)
+            driver.execute_script("arguments[0].click();", next_button)
+            # Without the info text, wait for the old first row to be redrawn away
+            WebDriverWait(driver, 15, poll_frequency=0.2).until(
+                (lambda d: d.find_element(*_TABLE_INFO).text != info_text) if info
+                else EC.staleness_of(first_row))
+            return True
         except Exception as e:
+            logger.warning(f"Could not move to the next page: {e}")
             return False
 
     def scrape_parallel_fast(self, date_list, max_workers=None):
-        """Fast parallel scraping"""
+        """Fast parallel scraping, yielding each date's cases as it completes"""
         if max_workers is None:
             max_workers = self.max_workers
             
-        all_cases = []
         completed_dates = 0
         
         print(f"Starting FAST parallel scraping with {max_workers} workers...")
         
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # Each worker process owns its own scraper and Chrome, so row parsing
+        # runs outside this process's GIL
+        max_workers = min(os.cpu_count() or 1, max_workers)
+        with ProcessPoolExecutor(max_workers=max_workers,
+                                 mp_context=multiprocessing.get_context('spawn'),
+                                 initializer=_init_worker) as executor:
             future_to_date = {
-                executor.submit(self.scrape_single_date_fast, date, i % max_workers): date 
+                executor.submit(_scrape_date_worker, date, i % max_workers): date 
                 for i, date in enumerate(date_list)
             }
             
@@ -508,13 +894,28 @@ class FastIHCScraper:
                 date = future_to_date[future]
                 try:
                     cases = future.result()
-                    all_cases.extend(cases)
                     completed_dates += 1
                     print(f"✅ FAST: Completed {date} ({completed_dates}/{len(date_list)}) - Found {len(cases)} cases")
                 except Exception as e:
                     logger.error(f"Error processing {date}: {e}")
-        
-        return all_cases
+                    continue
+                # as_completed yields in this thread only, so no lock is needed
+                yield cases
+
+# Per-process scraper used by ProcessPoolExecutor workers
+_WORKER_SCRAPER = None
+
+def _init_worker():
+    """Pool initializer; gives the worker its own scraper, closed on exit"""
+    global _WORKER_SCRAPER
+    _WORKER_SCRAPER = FastIHCScraper(max_workers=1)
+    Finalize(None, _WORKER_SCRAPER.close, exitpriority=10)
+    # Workers skip atexit, so write out buffered log records explicitly
+    Finalize(None, _log_buffer.flush, exitpriority=0)
+
+def _scrape_date_worker(date, thread_id):
+    """Scrape one date in a worker process"""
+    return _WORKER_SCRAPER.scrape_single_date_fast(date, thread_id)
 
 def get_user_input():
     print("\n=== FIXED IHC Case Scraper (Optimized for Speed) ===")
@@ -599,43 +1000,50 @@ def get_date_range(start_date_str, mode='range'):
             current += timedelta(days=1)
         return date_list
 
-def save_results(all_cases, config):
+def dump_case_line(case):
+    """Serialize one case as a UTF-8 JSON line, using orjson when available"""
+    if orjson:
+        return orjson.dumps(case) + b"\n"
+    return (json.dumps(case, ensure_ascii=False) + "\n").encode('utf-8')
+
+def get_output_path(config):
+    """Build the JSON Lines output path for this run"""
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     
     if config['mode'] == 'single':
-        filename = f"ihc_cases_fixed_single_{config['single_date'].replace('/', '-')}_{timestamp}.json"
+        filename = f"ihc_cases_fixed_single_{config['single_date'].replace('/', '-')}_{timestamp}.jsonl"
     else:
-        filename = f"ihc_cases_fixed_range_{config['start_date'].replace('/', '-')}_{timestamp}.json"
+        filename = f"ihc_cases_fixed_range_{config['start_date'].replace('/', '-')}_{timestamp}.jsonl"
     
     os.makedirs("output", exist_ok=True)
-    filepath = os.path.join("output", filename)
-    
-    output_data = {
-        "scrape_config": {
-            "mode": config['mode'],
-            "start_date": config['start_date'],
-            "end_date": datetime.now().strftime("%d/%m/%Y") if config['mode'] == 'range' else config.get('single_date', config['start_date']),
-            "max_workers": config['max_workers'],
-            "batch_size": config['batch_size'],
-            "total_cases": len(all_cases),
-            "fixes_applied": [
-                "Fixed function structure and indentation",
-                "Corrected method placement",
-                "Fixed advocate extraction with popup handling",
-                "Proper error handling",
-                "Maintained speed optimizations"
-            ]
-        },
-        "Cases": all_cases
+    return os.path.join("output", filename)
+
+def save_meta(filepath, config, total_cases):
+    """Write the scrape_config header to a .meta.json sidecar next to the cases"""
+    meta_path = filepath[:-len(".jsonl")] + ".meta.json"
+    scrape_config = {
+        "mode": config['mode'],
+        "start_date": config['start_date'],
+        "end_date": datetime.now().strftime("%d/%m/%Y") if config['mode'] == 'range' else config.get('single_date', config['start_date']),
+        "max_workers": config['max_workers'],
+        "batch_size": config['batch_size'],
+        "total_cases": total_cases,
+        "cases_file": os.path.basename(filepath),
+        "fixes_applied": [
+            "Fixed function structure and indentation",
+            "Corrected method placement",
+            "Fixed advocate extraction with popup handling",
+            "Proper error handling",
+            "Maintained speed optimizations"
+        ]
     }
     
     try:
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(output_data, f, ensure_ascii=False, indent=2)
-        logger.info(f"Saved {len(all_cases)} cases to {filepath}")
-        return filepath
+        with open(meta_path, 'w', encoding='utf-8') as f:
+            json.dump({"scrape_config": scrape_config}, f, ensure_ascii=False, indent=2)
+        return meta_path
     except Exception as e:
-        logger.error(f"Error saving results: {e}")
+        logger.error(f"Error saving metadata: {e}")
         return None
 
 def main():
@@ -660,33 +1068,46 @@ def main():
             return
         
         scraper = FastIHCScraper(max_workers=config['max_workers'])
+        filepath = get_output_path(config)
+        total_cases = 0
+        case = None
         start_time = time.time()
         
-        if config['mode'] == 'single':
-            all_cases = scraper.scrape_single_date_fast(date_list[0], 0, max_cases_per_date=20)
-        else:
-            all_cases = scraper.scrape_parallel_fast(date_list, config['max_workers'])
+        # Cases are streamed to disk as each date finishes instead of held in memory
+        try:
+            with open(filepath, 'wb', buffering=1 << 20) as f:
+                if config['mode'] == 'single':
+                    batches = [scraper.scrape_single_date_fast(date_list[0], 0, max_cases_per_date=20)]
+                else:
+                    batches = scraper.scrape_parallel_fast(date_list, config['max_workers'])
+                for cases in batches:
+                    for c in cases:
+                        f.write(dump_case_line(c))
+                    total_cases += len(cases)
+                    if case is None and cases:
+                        case = cases[0]
+        finally:
+            scraper.close()
         
         end_time = time.time()
         
-        if all_cases:
-            filepath = save_results(all_cases, config)
-            if filepath:
-                print(f"\n✅ FIXED scraping completed successfully!")
-                print(f"📁 File saved: {filepath}")
-                print(f"📊 Total cases: {len(all_cases)}")
-                print(f"⏱️ Total time: {(end_time - start_time):.2f} seconds")
-                print(f"🚀 Speed: {len(all_cases) / (end_time - start_time) * 60:.1f} cases/minute")
-                
-                if all_cases:
-                    case = all_cases[0]
-                    print(f"\n📋 Sample case data:")
-                    print(f"   Case No: {case.get('Case_No', 'N/A')}")
-                    print(f"   Title: {case.get('Case_Title', 'N/A')[:50]}...")
-                    print(f"   Bench: {len(case.get('Bench', []))} judge(s)")
-                    print(f"   Status: {case.get('Status', 'N/A')}")
-                    print(f"   Advocates: {case.get('Details', {}).get('Advocates', {})}")
+        if total_cases:
+            save_meta(filepath, config, total_cases)
+            print(f"\n✅ FIXED scraping completed successfully!")
+            print(f"📁 File saved: {filepath}")
+            print(f"📊 Total cases: {total_cases}")
+            print(f"⏱️ Total time: {(end_time - start_time):.2f} seconds")
+            print(f"🚀 Speed: {total_cases / (end_time - start_time) * 60:.1f} cases/minute")
+            
+            if case:
+                print(f"\n📋 Sample case data:")
+                print(f"   Case No: {case.get('Case_No', 'N/A')}")
+                print(f"   Title: {case.get('Case_Title', 'N/A')[:50]}...")
+                print(f"   Bench: {len(case.get('Bench', []))} judge(s)")
+                print(f"   Status: {case.get('Status', 'N/A')}")
+                print(f"   Advocates: {case.get('Details', {}).get('Advocates', {})}")
         else:
+            os.remove(filepath)
             print("\n⚠️ No cases found")
             
     except KeyboardInterrupt:
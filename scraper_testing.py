@@ -1,6 +1,7 @@
 import time
 import json
 import logging
+import logging.handlers
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.service import Service
@@ -9,21 +10,73 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException
 from webdriver_manager.chrome import ChromeDriverManager
+from lxml import html
 from datetime import datetime, timedelta
 import os
 import re
+import hashlib
+import multiprocessing
+import signal
+import diskcache
 
-# Configure logging (INFO level to reduce terminal output)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+from multiprocessing.util import Finalize
+
+# Configure logging (INFO level to reduce terminal output). Records are
+# buffered in memory and written in batches, or at once on a warning.
+_log_file = logging.FileHandler("ihc_scraper.log", encoding='utf-8', delay=True)
+_log_file.setFormatter(logging.Formatter("%(asctime)s - %(levelname)s - %(message)s"))
+_log_buffer = logging.handlers.MemoryHandler(capacity=512, flushLevel=logging.WARNING, target=_log_file)
 logging.basicConfig(
     level=logging.INFO,  # Changed to INFO to reduce debug noise
-    format="%(asctime)s - %(levelname)s - %(message)s",
     handlers=[
-        logging.FileHandler("ihc_scraper.log", encoding='utf-8')
+        _log_buffer
         # Removed StreamHandler to stop logging to terminal
     ]
 )
 logger = logging.getLogger(__name__)
 
+# Minimum seconds between two date searches made by one worker
+SEARCH_INTERVAL = 2
+
+# Number of worker processes, each driving its own headless Chrome
+WORKERS = 4
+
+# Resources the scraper never needs; blocked at the network layer
+BLOCKED_URLS = ["*.png", "*.jpg", "*.jpeg", "*.gif", "*.svg", "*.ico", "*.css", "*.woff*", "*.ttf", "*google-analytics*"]
+
+# Scraped results keyed by date; past dates never change, recent ones expire.
+# Opened per worker by _open_cache so importing this module touches no files.
+CACHE_DIR = os.path.join("output", ".cache")
+CACHE = None
+RECENT_TTL = 3600
+PAGE_TTL = 24 * 3600
+
+# Per-process WebDriver, reused across all dates handled by that worker
+_DRIVER = None
+_DRIVER_PATH = None
+_last_search = 0.0
+
+# Pre-compiled patterns used by the per-cell classifier.
+# _RE_CELL_KIND classifies a cell in one match() call: each branch is a
+# lookahead for one field, tried in priority order, and m.lastgroup names
+# the field that matched.
+_RE_CELL_KIND = re.compile(
+    r'(?=.*?(?i:\d+/\d{4}|W\.P|Crl|Civil))(?P<case_no>)'
+    r'|(?=.*? (?:VS|vs|V/S|v/s) )(?P<title>)'
+    r'|(?=.*?\d{1,2}[-/]\d{1,2}[-/]\d{4})(?P<date>)'
+    r'|(?=.*?(?i:pending|disposed|fixed|adjourned|decided))(?P<status>)'
+    r'|(?=.*?(?:Justice|Hon|CJ))(?P<bench>)',
+    re.DOTALL
+)
+_RE_VS_SPLIT = re.compile(r'\s+(VS|vs|V/S|v/s|- VS -)\s+')
+_RE_SPLIT_BENCH = re.compile(r',|and')
+_RE_WS = re.compile(r'\s+')
+_RE_INFO = re.compile(r'([\d,]+)\s+to\s+([\d,]+)\s+of\s+([\d,]+)')
+
 def get_user_input():
     """Get user preferences for date range"""
     print("\n=== IHC Case Scraper ===")
@@ -39,13 +92,14 @@ def get_user_input():
 def get_date_range(start_date_str):
     """Generate date list from start date to current date"""
     start_date = datetime.strptime(start_date_str, "%d/%m/%Y")
-    end_date = datetime.now()
-    date_list = []
-    current = start_date
-    while current <= end_date:
-        date_list.append(current.strftime("%d-%m-%Y"))  # Format with -
-        current += timedelta(days=1)
-    return date_list
+    days = (datetime.now() - start_date).days + 1
+    return [(start_date + timedelta(days=i)).strftime("%d-%m-%Y") for i in range(days)]  # Format with -
+
+def _driver_path():
+    """Resolve the chromedriver binary once per process"""
+    global _DRIVER_PATH
+    _DRIVER_PATH = _DRIVER_PATH or ChromeDriverManager().install()
+    return _DRIVER_PATH
 
 def setup_webdriver():
     """Setup Chrome WebDriver with auto-driver management"""
@@ -53,106 +107,154 @@ def setup_webdriver():
         options = Options()
         options.add_argument("--no-sandbox")
         options.add_argument("--disable-dev-shm-usage")
-        # Browser opens visibly for debugging
+        options.add_argument("--headless=new")
+        options.add_argument("--disable-gpu")
+        options.add_argument("--disable-extensions")
+        options.add_argument("--blink-settings=imagesEnabled=false")
+        options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.default_content_setting_values.notifications": 2
+        })
         
         logger.info("Installing/setting up ChromeDriver...")
-        service = Service(ChromeDriverManager().install())
+        service = Service(_driver_path())
         driver = webdriver.Chrome(service=service, options=options)
-        driver.implicitly_wait(5)
+        
+        # Only the page HTML and its scripts are needed; drop static assets
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URLS})
+        driver.implicitly_wait(0)  # rely on explicit WebDriverWait only
         logger.info("WebDriver initialized successfully")
         return driver
     except Exception as e:
         logger.error(f"Failed to initialize WebDriver: {str(e)}")
         raise
 
+# Empty case record; nested dicts and lists are copied per row in new_case_data
+_ORDER_SKELETON = {"Sr": 1, "Hearing_Date": "N/A", "Bench": [], "List_Type": "N/A",
+                   "Case_Stage": "N/A", "Short_Order": "N/A", "Disposal_Date": "N/A",
+                   "Order_File": "N/A"}
+_COMMENT_SKELETON = {"Compliance_Date": "N/A", "Case_No": "N/A", "Case_Title": "N/A",
+                     "Doc_Type": "N/A", "Parties": "N/A", "Description": "No comments available",
+                     "View_File": "N/A"}
+_CM_SKELETON = {"Sr": 1, "CM": "N/A", "Institution_Date": "N/A", "Disposal_Date": "N/A",
+                "Order_Passed": "N/A", "Description": "No CMs available", "Status": "N/A"}
+_DISPOSAL_SKELETON = {
+    "Disposed_Status": "N/A",
+    "Case_Disposal_Date": "N/A",
+    "Disposal_Bench": [],
+    "Consigned_Date": "N/A"
+}
+_FIR_SKELETON = {
+    "FIR_No": "N/A",
+    "FIR_Date": "N/A",
+    "Police_Station": "N/A",
+    "Under_Section": "N/A",
+    "Incident": "N/A",
+    "Accused": "N/A"
+}
+_DETAILS_SKELETON = {
+    "Case_No": "N/A",
+    "Case_Status": "N/A",
+    "Hearing_Date": "N/A",
+    "Case_Stage": "N/A",
+    "Tentative_Date": "N/A",
+    "Short_Order": "N/A",
+    "Before_Bench": [],
+    "Case_Title": "N/A",
+    "Advocates": None,
+    "Case_Description": "N/A",
+    "Disposal_Information": None,
+    "FIR_Information": None
+}
+_CASE_SKELETON = {
+    "Sr": None,
+    "Institution_Date": None,
+    "Case_No": "N/A",
+    "Case_Title": "N/A",
+    "Bench": [],
+    "Hearing_Date": "N/A",
+    "Case_Category": "N/A",
+    "Status": "N/A",
+    "Orders": None,
+    "Comments": None,
+    "CMs": None,
+    "Details": None
+}
+
+def new_case_data(row_index, date):
+    """Build an empty case record from the skeletons (faster than deepcopy)"""
+    details = {
+        **_DETAILS_SKELETON,
+        "Before_Bench": [],
+        "Advocates": {"Petitioner": "N/A", "Respondent": "N/A"},
+        "Disposal_Information": {**_DISPOSAL_SKELETON, "Disposal_Bench": []},
+        "FIR_Information": {**_FIR_SKELETON}
+    }
+    return {
+        **_CASE_SKELETON,
+        "Sr": row_index,
+        "Institution_Date": date,
+        "Bench": [],
+        "Orders": [{**_ORDER_SKELETON, "Bench": []}],
+        "Comments": [{**_COMMENT_SKELETON}],
+        "CMs": [{**_CM_SKELETON}],
+        "Details": details
+    }
+
+def _is_old(date):
+    """True when a DD-MM-YYYY date is old enough that its results are final"""
+    return datetime.strptime(date, "%d-%m-%Y") < datetime.now() - timedelta(days=2)
+
 def extract_clean_text(element):
-    """Extract and clean text from web element"""
+    """Extract and clean text from a parsed lxml element"""
     try:
-        text = element.get_attribute('textContent') or element.text or ""
-        return re.sub(r'\s+', ' ', text.strip()) if text.strip() else "N/A"
+        text = element.text_content()
+        return _RE_WS.sub(' ', text.strip()) if text.strip() else "N/A"
     except:
         return "N/A"
 
 def extract_case_data(row, row_index, date):
-    """Extract case data matching desired JSON structure"""
+    """Extract case data matching desired JSON structure from an lxml <tr>"""
     try:
-        cells = row.find_elements(By.TAG_NAME, "td")
+        cells = row.findall("td")
         if len(cells) < 5:
             return None
 
         cell_texts = [extract_clean_text(cell) for cell in cells]
         
-        case_data = {
-            "Sr": row_index,
-            "Institution_Date": date,
-            "Case_No": "N/A",
-            "Case_Title": "N/A",
-            "Bench": [],
-            "Hearing_Date": "N/A",
-            "Case_Category": "N/A",
-            "Status": "N/A",
-            "Orders": [{"Sr": 1, "Hearing_Date": "N/A", "Bench": [], "List_Type": "N/A", 
-                       "Case_Stage": "N/A", "Short_Order": "N/A", "Disposal_Date": "N/A", 
-                       "Order_File": "N/A"}],
-            "Comments": [{"Compliance_Date": "N/A", "Case_No": "N/A", "Case_Title": "N/A", 
-                         "Doc_Type": "N/A", "Parties": "N/A", "Description": "No comments available", 
-                         "View_File": "N/A"}],
-            "CMs": [{"Sr": 1, "CM": "N/A", "Institution_Date": "N/A", "Disposal_Date": "N/A", 
-                    "Order_Passed": "N/A", "Description": "No CMs available", "Status": "N/A"}],
-            "Details": {
-                "Case_No": "N/A",
-                "Case_Status": "N/A",
-                "Hearing_Date": "N/A",
-                "Case_Stage": "N/A",
-                "Tentative_Date": "N/A",
-                "Short_Order": "N/A",
-                "Before_Bench": [],
-                "Case_Title": "N/A",
-                "Advocates": {"Petitioner": "N/A", "Respondent": "N/A"},
-                "Case_Description": "N/A",
-                "Disposal_Information": {
-                    "Disposed_Status": "N/A",
-                    "Case_Disposal_Date": "N/A",
-                    "Disposal_Bench": [],
-                    "Consigned_Date": "N/A"
-                },
-                "FIR_Information": {
-                    "FIR_No": "N/A",
-                    "FIR_Date": "N/A",
-                    "Police_Station": "N/A",
-                    "Under_Section": "N/A",
-                    "Incident": "N/A",
-                    "Accused": "N/A"
-                }
-            }
-        }
+        case_data = new_case_data(row_index, date)
 
         # Extract basic case info
-        for i, text in enumerate(cell_texts):
-            if re.search(r'\d+/\d{4}|W\.P|Crl|Civil', text, re.IGNORECASE):
+        for text in cell_texts:
+            match = _RE_CELL_KIND.match(text)
+            if not match:
+                continue
+            kind = match.lastgroup
+            if kind == "case_no":
                 case_data["Case_No"] = text
                 case_data["Details"]["Case_No"] = text
                 case_data["Comments"][0]["Case_No"] = text
-            elif any(vs in text for vs in [' VS ', ' vs ', ' V/S ', ' v/s ', ' - VS - ']):
+            elif kind == "title":
                 case_data["Case_Title"] = text
                 case_data["Details"]["Case_Title"] = text
                 case_data["Comments"][0]["Case_Title"] = text
                 case_data["Comments"][0]["Parties"] = text
-                parts = re.split(r'\s+(VS|vs|V/S|v/s|- VS -)\s+', text)
+                parts = _RE_VS_SPLIT.split(text)
                 if len(parts) >= 3:
                     case_data["Details"]["Advocates"]["Petitioner"] = parts[0].strip()
                     case_data["Details"]["Advocates"]["Respondent"] = parts[2].strip()
-            elif re.search(r'\d{1,2}[-/]\d{1,2}[-/]\d{4}', text):
+            elif kind == "date":
                 case_data["Hearing_Date"] = text
                 case_data["Details"]["Hearing_Date"] = text
                 case_data["Orders"][0]["Hearing_Date"] = text
-            elif any(status in text.lower() for status in ['pending', 'disposed', 'fixed', 'adjourned', 'decided']):
+            elif kind == "status":
                 case_data["Status"] = text
                 case_data["Details"]["Case_Status"] = text
                 case_data["Details"]["Short_Order"] = text
                 case_data["Orders"][0]["Short_Order"] = text
-            elif any(title in text for title in ['Justice', 'Hon', 'CJ']):
-                bench = [b.strip() for b in re.split(r',|and', text) if b.strip()]
+            else:
+                bench = [b.strip() for b in _RE_SPLIT_BENCH.split(text) if b.strip()]
                 case_data["Bench"] = bench
                 case_data["Orders"][0]["Bench"] = bench
                 case_data["Details"]["Before_Bench"] = bench
@@ -161,52 +263,103 @@ def extract_case_data(row, row_index, date):
         if case_data["Case_No"] == "N/A":
             return None
 
-        print(f"    → Extracted: {case_data['Case_No']}")
         return case_data
 
     except Exception as e:
         print(f"    → Error extracting case {row_index}: {e}")
         return None
 
+def get_table_html(driver):
+    """Return the results table's outerHTML via CDP Runtime.evaluate"""
+    result = driver.execute_cdp_cmd("Runtime.evaluate", {
+        "expression": "document.getElementById('tblCases').outerHTML",
+        "returnByValue": True
+    })
+    return result["result"]["value"]
+
 def extract_cases_from_page(driver, date, page_num):
-    """Extract cases from current page"""
+    """Extract cases from current page
+    
+    Returns (cases, ok); ok is False when the page could not be read fully,
+    in which case cases holds whatever was extracted before the failure.
+    """
     cases = []
     try:
-        wait = WebDriverWait(driver, 15)
-        table = wait.until(EC.visibility_of_element_located((By.ID, "tblCases")))
+        # Wait for a non-empty cell, or DataTables' "No data available" placeholder
+        cell = WebDriverWait(driver, 15, poll_frequency=0.2).until(EC.any_of(
+            EC.presence_of_element_located((By.CSS_SELECTOR, "#tblCases > tbody > tr > td:not(.dataTables_empty):not(:empty)")),
+            EC.presence_of_element_located((By.CSS_SELECTOR, "#tblCases > tbody > tr > td.dataTables_empty"))))
+        if 'dataTables_empty' in (cell.get_attribute('class') or ''):
+            print(f"    → No cases on page {page_num}")
+            return cases, True
         
-        # Wait for at least one data row
-        wait.until(EC.presence_of_element_located((By.XPATH, "//table[@id='tblCases']//tbody/tr")))
+        # Pull the whole table in one call and parse it locally
+        table_html = get_table_html(driver)
         
-        # Get data rows from tbody
-        rows = table.find_elements(By.XPATH, ".//tbody/tr")
+        # Skip re-parsing a page whose HTML we have already seen for this date
+        page_key = ("page", date, hashlib.md5(table_html.encode('utf-8')).hexdigest())
+        cached = CACHE.get(page_key)
+        if cached is not None:
+            print(f"    → Page {page_num} unchanged, using cached cases")
+            return cached, True
+        
+        tree = html.fromstring(table_html)
+        rows = tree.xpath("./tbody/tr")
         print(f"    → Found {len(rows)} rows on page {page_num}")
         
         for i, row in enumerate(rows, 1):
             case_data = extract_case_data(row, i, date)
             if case_data:
                 cases.append(case_data)
+                # Progress every 10 cases rather than a line per row
+                if len(cases) % 10 == 0:
+                    print(f"    → Extracted {len(cases)} cases (latest: {case_data['Case_No']})")
         
-        return cases
+        CACHE.set(page_key, cases, expire=PAGE_TTL)
+        return cases, True
     except TimeoutException:
         print(f"    → Timeout waiting for table on page {page_num}")
-        return cases
+        return cases, False
     except Exception as e:
         print(f"    → Error extracting from page {page_num}: {e}")
-        return cases
+        return cases, False
 
 def get_pagination_info(driver):
     """Get current pagination information"""
     try:
-        info_xpath = "//div[@id='tblCases_info']"
-        info_element = driver.find_element(By.XPATH, info_xpath)
-        info_text = extract_clean_text(info_element)
-        return info_text
+        info_element = driver.find_element(By.ID, "tblCases_info")
+        return _RE_WS.sub(' ', info_element.text.strip())
     except NoSuchElementException:
         return None
 
+def show_all_rows(driver):
+    """Raise the DataTable page length so a whole date usually fits on one page"""
+    info = get_pagination_info(driver)
+    match = _RE_INFO.search(info or "")
+    if not match:
+        return
+    shown, total = (int(g.replace(',', '')) for g in match.group(2, 3))
+    if shown >= total:
+        return
+    
+    # Use "All" or the largest option the length menu offers, else ask for 500
+    driver.execute_script("""
+        var lengths = $('select[name="tblCases_length"] option').map(function () { return +this.value; }).get();
+        var len = 500;
+        if (lengths.length) {
+            len = lengths.indexOf(-1) >= 0 ? -1 : Math.max.apply(null, lengths);
+        }
+        $('#tblCases').DataTable().page.len(len).draw();
+    """)
+    WebDriverWait(driver, 15).until(lambda d: get_pagination_info(d) != info)
+    print(f"  → Page length raised: {get_pagination_info(driver)}")
+
 def has_next_page_simple(driver):
-    """Simplified and correct function to check and click next page button"""
+    """Simplified and correct function to check and click next page button
+    
+    Returns True after moving to the next page, False on the last page, and
+    None when the check itself failed, so the caller can tell the two apart.
+    """
     try:
         print("  → Checking for next page...")
         
@@ -217,7 +370,7 @@ def has_next_page_simple(driver):
         # Find the Next button - DataTables uses specific structure
         # Look for: <a class="paginate_button next" ...>Next</a>
         try:
-            next_button = pagination_div.find_element(By.XPATH, ".//a[contains(@class, 'paginate_button') and contains(@class, 'next')]")
+            next_button = pagination_div.find_element(By.CSS_SELECTOR, "a.paginate_button.next")
             
             # Check if the next button is disabled
             button_classes = next_button.get_attribute('class')
@@ -232,28 +385,24 @@ def has_next_page_simple(driver):
                 try:
                     current_info = driver.find_element(By.ID, "tblCases_info").text
                     print(f"  → Current: {current_info}")
-                except:
+                except NoSuchElementException:
                     current_info = None
                 
                 # Click the next button
                 driver.execute_script("arguments[0].click();", next_button)
                 print("  → Clicked Next button")
                 
-                # Wait for page to change
-                time.sleep(3)
-                
-                # Verify page actually changed
+                # Wait for the page info to change
                 try:
+                    WebDriverWait(driver, 10).until(
+                        lambda d: d.find_element(By.ID, "tblCases_info").text != current_info
+                    )
                     new_info = driver.find_element(By.ID, "tblCases_info").text
-                    if new_info != current_info:
-                        print(f"  → Page changed to: {new_info}")
-                        return True
-                    else:
-                        print("  → Page didn't change - might be last page")
-                        return False
-                except:
-                    print("  → Assuming page changed (couldn't verify)")
+                    print(f"  → Page changed to: {new_info}")
                     return True
+                except TimeoutException:
+                    print("  → Next button was enabled but the page didn't change")
+                    return None
                     
         except NoSuchElementException:
             print("  → Next button not found - reached last page")
@@ -261,59 +410,122 @@ def has_next_page_simple(driver):
             
     except Exception as e:
         print(f"  → Pagination check failed: {e}")
-        return False
+        return None
+
+def open_search_form(driver):
+    """Load the case search page and open the advanced search panel once"""
+    driver.get("https://mis.ihc.gov.pk/frmCseSrch")
+    wait = WebDriverWait(driver, 15)
+    adv_btn = wait.until(EC.element_to_be_clickable((By.ID, "lnkAdvncSrch")))
+    adv_btn.click()
+    wait.until(EC.presence_of_element_located((By.ID, "txtDt")))
+    print("  → Search form ready")
+
+def _init_driver():
+    """Start this worker's WebDriver and open the search form"""
+    global _DRIVER
+    _DRIVER = setup_webdriver()
+    open_search_form(_DRIVER)
+    # Pool workers leave through os._exit, which skips atexit hooks
+    Finalize(None, _quit_driver, exitpriority=10)
+
+def _open_cache():
+    """Open the on-disk results cache once per process"""
+    global CACHE
+    if CACHE is None:
+        CACHE = diskcache.Cache(CACHE_DIR)
+    return CACHE
+
+def _init_worker():
+    """Pool initializer; a failed start is retried lazily by scrape_date"""
+    Finalize(None, _log_buffer.flush, exitpriority=0)
+    # Ctrl-C is handled by the parent, which stops the pool with SIGTERM
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, _terminate_worker)
+    _open_cache()
+    try:
+        _init_driver()
+    except Exception as e:
+        logger.error(f"Worker could not start WebDriver: {e}")
 
-def scrape_date(driver, date):
-    """Scrape all cases for a specific date"""
+def _quit_driver():
+    """Close this worker's WebDriver"""
+    global _DRIVER
+    if _DRIVER:
+        _DRIVER.quit()
+        _DRIVER = None
+        logger.info("WebDriver closed")
+
+def _terminate_worker(signum, frame):
+    """SIGTERM from Pool.terminate(): quit the driver, which Finalize would skip"""
+    _quit_driver()
+    _log_buffer.flush()
+    os._exit(1)
+
+def scrape_date(date):
+    """Scrape all cases for a specific date using this worker's WebDriver"""
+    global _last_search
     logger.info(f"Scraping cases for {date}")
     all_cases = []
     page = 1
     
+    cached = _open_cache().get(date)
+    if cached is not None:
+        print(f"  → Using cached results for {date}")
+        return cached
+    
     try:
-        driver.get("https://mis.ihc.gov.pk/frmCseSrch")
+        if _DRIVER is None:
+            _init_driver()
+        driver = _DRIVER
         wait = WebDriverWait(driver, 15)
         
-        # Click advanced search
-        adv_btn = wait.until(EC.element_to_be_clickable((By.ID, "lnkAdvncSrch")))
-        adv_btn.click()
-        print("  → Clicked advanced search")
-        time.sleep(2)
+        # Keep searches at least SEARCH_INTERVAL apart to be respectful to the server
+        remaining = SEARCH_INTERVAL - (time.monotonic() - _last_search)
+        if remaining > 0:
+            time.sleep(remaining)
+        _last_search = time.monotonic()
         
-        # Enter date
-        date_input = wait.until(EC.presence_of_element_located((By.ID, "txtDt")))
-        date_input.clear()
-        input_date = date  # Already in DD-MM-YYYY
-        date_input.send_keys(input_date)
-        print(f"  → Entered date: {input_date}")
-        time.sleep(1)
+        # Remember the current first row so we can tell when the table is redrawn
+        old_rows = driver.find_elements(By.CSS_SELECTOR, "#tblCases > tbody > tr")
         
-        # Click search
-        search_btn = wait.until(EC.element_to_be_clickable((By.ID, "btnAdvnSrch")))
-        search_btn.click()
-        print("  → Clicked search button")
-        time.sleep(5)  # Wait for results to load
+        # Set the date and submit without reloading the search page
+        driver.execute_script(
+            "document.getElementById('txtDt').value = arguments[0];"
+            "document.getElementById('btnAdvnSrch').click();",
+            date
+        )
+        print(f"  → Submitted search for {date}")
         
-        # Wait for results container
-        wait.until(EC.visibility_of_element_located((By.ID, "grdCaseInfo")))
+        if old_rows:
+            wait.until(EC.staleness_of(old_rows[0]))
+        wait.until(EC.text_to_be_present_in_element((By.ID, "tblCases_info"), "Showing"))
         print("  → Results loaded")
         
-        # Additional wait for table to fully load
-        wait.until(EC.visibility_of_element_located((By.ID, "tblCases")))
-        time.sleep(3)
+        try:
+            show_all_rows(driver)
+        except Exception as e:
+            logger.warning(f"Could not raise page length for {date}: {e}")
         
         # Get initial pagination info
         initial_info = get_pagination_info(driver)
         print(f"  → {initial_info}")
         
-        # Process all pages
+        # Process all pages; any failed page or pagination check marks the date incomplete
+        complete = True
         while True:
             print(f"  → Processing page {page}")
-            page_cases = extract_cases_from_page(driver, date, page)
+            page_cases, ok = extract_cases_from_page(driver, date, page)
+            complete = complete and ok
             all_cases.extend(page_cases)
             print(f"  → Extracted {len(page_cases)} cases from page {page}")
             
             # Check if there's a next page
-            if not has_next_page_simple(driver):
+            has_next = has_next_page_simple(driver)
+            if has_next is None:
+                complete = False
+                break
+            if not has_next:
                 print(f"  → Reached last page for {date}. Total pages: {page}")
                 break
             
@@ -322,9 +534,15 @@ def scrape_date(driver, date):
             # Safety check to prevent infinite loops
             if page > 50:  # Reasonable upper limit
                 print(f"  → Reached maximum page limit (50) for {date}")
+                complete = False
                 break
         
         print(f"Total cases extracted for {date}: {len(all_cases)}")
+        # Only a complete scrape is cached; a short result would stick for old dates
+        if complete:
+            CACHE.set(date, all_cases, expire=None if _is_old(date) else RECENT_TTL)
+        else:
+            logger.warning(f"Results for {date} are incomplete; not caching them")
         return all_cases
         
     except TimeoutException:
@@ -334,67 +552,67 @@ def scrape_date(driver, date):
         print(f"  → Error scraping {date}: {e}")
         return all_cases
 
-def save_results(all_cases, start_date):
-    """Save results to JSON file"""
+def dump_case_line(case):
+    """Serialize one case as a UTF-8 JSON line, using orjson when available"""
+    if orjson:
+        return orjson.dumps(case) + b"\n"
+    return (json.dumps(case, ensure_ascii=False) + "\n").encode('utf-8')
+
+def get_output_path(start_date):
+    """Build the JSON Lines output path for this run"""
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    filename = f"ihc_cases_{start_date.replace('/', '-')}_{timestamp}.json"
+    filename = f"ihc_cases_{start_date.replace('/', '-')}_{timestamp}.jsonl"
     os.makedirs("output", exist_ok=True)
-    filepath = os.path.join("output", filename)
-    
-    output_data = {
-        "Cases": all_cases
-    }
-    
-    try:
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(output_data, f, ensure_ascii=False, indent=2)
-        logger.info(f"Saved {len(all_cases)} cases to {filepath}")
-        return filepath
-    except Exception as e:
-        logger.error(f"Error saving results: {e}")
-        return None
+    return os.path.join("output", filename)
 
 def main():
     """Main function"""
-    driver = None
     try:
         config = get_user_input()
         date_list = get_date_range(config['start_date'])
         
         print(f"\nDate range: {config['start_date']} to today ({len(date_list)} dates total)")
+        if not date_list:
+            print("\n⚠️ No cases found across all dates")
+            return
         logger.info(f"Starting scraper for {len(date_list)} dates")
-        print("Initializing WebDriver...")
-        driver = setup_webdriver()
-        print("WebDriver ready. Starting scraping...")
+        workers = min(WORKERS, len(date_list))
+        print(f"Starting {workers} headless WebDriver workers...")
         
-        all_cases = []
-        for i, date in enumerate(date_list, 1):
-            print(f"\n--- Processing date {i}/{len(date_list)}: {date} ---")
-            date_cases = scrape_date(driver, date)
-            all_cases.extend(date_cases)
-            print(f"Cases found for {date}: {len(date_cases)}")
-            
-            # Small delay between dates to be respectful to the server
-            time.sleep(2)
+        # Cases are written one per line as each date finishes, so memory stays O(one date)
+        filepath = get_output_path(config['start_date'])
+        total_cases = 0
+        pool = multiprocessing.Pool(workers, initializer=_init_worker)
+        try:
+            with open(filepath, 'wb', buffering=1 << 20) as f:
+                for i, (date, date_cases) in enumerate(zip(date_list, pool.imap(scrape_date, date_list)), 1):
+                    for case in date_cases:
+                        f.write(dump_case_line(case))
+                    total_cases += len(date_cases)
+                    print(f"Cases found for {date} ({i}/{len(date_list)}): {len(date_cases)}")
+        except BaseException:
+            # Error or Ctrl-C: terminate() sends SIGTERM, and each worker quits
+            # its driver in _terminate_worker before exiting
+            print("\nStopping workers and closing WebDrivers...")
+            pool.terminate()
+            raise
+        else:
+            # close/join lets workers exit normally so their drivers are quit
+            pool.close()
+        finally:
+            pool.join()
         
-        if all_cases:
-            filepath = save_results(all_cases, config['start_date'])
-            if filepath:
-                print(f"\n✅ Scraping completed! Saved to {filepath}")
-                print(f"📊 Total cases across all dates: {len(all_cases)}")
-            else:
-                print("\n❌ Error saving results. Check ihc_scraper.log for details.")
+        if total_cases:
+            logger.info(f"Saved {total_cases} cases to {filepath}")
+            print(f"\n✅ Scraping completed! Saved to {filepath}")
+            print(f"📊 Total cases across all dates: {total_cases}")
         else:
+            os.remove(filepath)
             print("\n⚠️ No cases found across all dates")
             
     except Exception as e:
         logger.error(f"Unexpected error in main: {e}")
         print(f"\n❌ Error: {e}. Check ihc_scraper.log for details.")
-    finally:
-        if driver:
-            driver.quit()
-            logger.info("WebDriver closed")
-            print("WebDriver closed.")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file